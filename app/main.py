@@ -1,15 +1,119 @@
-import io
+import asyncio
+import hashlib
+import operator
+import os
+import re
+import stat
+import tempfile
+import time
 import zipfile
+from contextlib import asynccontextmanager, suppress
+from typing import NamedTuple
+import aiohttp
 import edge_tts
+import orjson
 from fastapi import FastAPI, Form, HTTPException
-from fastapi.responses import FileResponse, Response
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
 
-app = FastAPI(title="Text-to-Speech Converter")
+
+class _SharedConnector(aiohttp.TCPConnector):
+    """TCP connector that outlives the per-call sessions edge-tts opens on it.
+
+    edge-tts wraps every call in its own ClientSession, which closes the connector
+    on exit; ignore that so the DNS cache and keep-alive pool persist until shutdown.
+    """
+
+    async def close(self, **kwargs):
+        pass
+
+    async def shutdown(self):
+        await super().close()
+
+
+_connector = None
+# Created per app run, as asyncio primitives belong to the loop they first wait on
+_voices_lock = None
+_segment_semaphore = None
+
+
+# How long the shared connector caches resolved addresses for the service
+DNS_CACHE_TTL = 300
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """Share one aiohttp connector across all edge-tts calls and keep it warm."""
+    global _connector, _voices_lock, _segment_semaphore
+    _connector = _SharedConnector(limit=32, keepalive_timeout=60, ttl_dns_cache=DNS_CACHE_TTL)
+    _voices_lock = asyncio.Lock()
+    _segment_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEGMENTS)
+    warmup = asyncio.create_task(_warmup_loop())
+    try:
+        yield
+    finally:
+        warmup.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup
+        await _connector.shutdown()
+        _connector = None
+
+
+app = FastAPI(title="Text-to-Speech Converter", lifespan=lifespan)
 
 # Serve static files (frontend)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
+# Largest /api/convert body accepted. Worst case is 10000 four-byte UTF-8 characters
+# sent urlencoded, where every byte becomes %XX: 120000 bytes plus the other fields.
+MAX_CONVERT_BODY = 128 * 1024
+
+
+class _ConvertBodyLimit:
+    """ASGI middleware that caps /api/convert request bodies at MAX_CONVERT_BODY bytes.
+
+    Declared lengths are rejected before the body is read; chunked uploads are
+    counted as they arrive and cut off as soon as they pass the limit.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] != "/api/convert":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None:
+            if not content_length.isdigit():
+                response = JSONResponse(status_code=400, content={"detail": "Invalid Content-Length"})
+                await response(scope, receive, send)
+                return
+            if int(content_length) > MAX_CONVERT_BODY:
+                response = JSONResponse(status_code=413, content={"detail": "Request too large"})
+                await response(scope, receive, send)
+                return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > MAX_CONVERT_BODY:
+                    # FastAPI re-raises HTTPExceptions from body parsing, so this becomes a 413
+                    raise HTTPException(status_code=413, detail="Request too large")
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+app.add_middleware(_ConvertBodyLimit)
+
 
 @app.get("/")
 async def root():
@@ -17,22 +121,330 @@ async def root():
     return FileResponse("static/index.html")
 
 
+# The voice catalog rarely changes, so only refetch it hourly
+VOICES_TTL = 3600
+
+
+class _VoicesCache(NamedTuple):
+    """A fetched voice catalog, ready to serve and to validate against."""
+
+    fetched_at: float
+    body: bytes  # JSON for /api/voices, encoded once with orjson
+    names: frozenset
+
+
+_voices_cache = None
+
+
+async def _refresh_voices():
+    """Fetch the voice list from edge-tts and store it in the cache."""
+    global _voices_cache
+    voices = await edge_tts.list_voices(connector=_connector)
+    # Simplify voice data, sorted by locale then name
+    result = []
+    for v in voices:
+        locale = v["Locale"]
+        result.append({
+            "name": v["ShortName"],
+            "gender": v["Gender"],
+            "locale": locale,
+            "language": locale.partition("-")[0],
+        })
+    result.sort(key=operator.itemgetter("locale", "name"))
+
+    # Encode once with orjson so requests skip JSON serialization entirely
+    _voices_cache = _VoicesCache(
+        fetched_at=time.monotonic(),
+        body=orjson.dumps(result),
+        names=frozenset(v["name"] for v in result),
+    )
+    return _voices_cache
+
+
+async def _get_voices():
+    """Return the cached voices entry, refetching it from edge-tts once the TTL expires."""
+    if _voices_cache and time.monotonic() - _voices_cache.fetched_at < VOICES_TTL:
+        return _voices_cache
+
+    # Only one request refetches; the others wait and reuse its result
+    async with _voices_lock:
+        if _voices_cache and time.monotonic() - _voices_cache.fetched_at < VOICES_TTL:
+            return _voices_cache
+        return await _refresh_voices()
+
+
+# Stop keeping the connection warm once the app has been idle this long
+WARMUP_IDLE_AFTER = 30 * 60
+
+_last_activity = time.monotonic()
+
+
+def _mark_active():
+    """Record that the app is in use, so the warmup loop keeps running."""
+    global _last_activity
+    _last_activity = time.monotonic()
+
+
+async def _warmup_loop():
+    """Keep the shared connector's DNS entry for the service fresh while the app is in use.
+
+    Waiting a full DNS_CACHE_TTL between rounds makes each refresh land just after
+    the cached address expires, so it re-resolves and real requests find it warm.
+    The voice list is the cheapest request to the same host, and refreshing it
+    also keeps the voice cache current. Runs without _voices_lock, so requests
+    never wait on it.
+    """
+    while True:
+        if time.monotonic() - _last_activity < WARMUP_IDLE_AFTER:
+            try:
+                await _refresh_voices()
+            except Exception:
+                pass  # Offline or throttled; try again next round
+        await asyncio.sleep(DNS_CACHE_TTL)
+
+
 @app.get("/api/voices")
 async def list_voices():
     """List available TTS voices."""
-    voices = await edge_tts.list_voices()
-    # Return simplified voice data, sorted by locale then name
-    result = [
-        {
-            "name": v["ShortName"],
-            "gender": v["Gender"],
-            "locale": v["Locale"],
-            "language": v["Locale"].split("-")[0],
-        }
-        for v in voices
-    ]
-    result.sort(key=lambda x: (x["locale"], x["name"]))
-    return result
+    _mark_active()
+    voices = await _get_voices()
+    return Response(content=voices.body, media_type="application/json")
+
+
+# Long texts are synthesized in sentence-aligned segments of about this many characters
+SEGMENT_CHARS = 500
+# Cap on background segment syntheses across all requests, to avoid upstream throttling
+MAX_CONCURRENT_SEGMENTS = 3
+
+# edge-tts returns 48 kbps CBR MP3, so audio byte counts convert exactly to offset ticks
+MP3_BITRATE = 48000
+TICKS_PER_SECOND = 10_000_000
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def segment_text(text):
+    """Split text into sentence-aligned segments of roughly SEGMENT_CHARS characters."""
+    segments = []
+    current = ""
+    for sentence in _SENTENCE_END.split(text):
+        if current and len(current) + len(sentence) >= SEGMENT_CHARS:
+            segments.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    segments.append(current)
+    return segments
+
+
+def _communicate(text, voice, boundary):
+    """Create an edge-tts stream on the shared connector."""
+    return edge_tts.Communicate(text, voice=voice, boundary=boundary, connector=_connector)
+
+
+async def _synthesize_segment(text, voice, boundary):
+    """Synthesize one segment in full, returning its audio chunks and boundary events.
+
+    The chunks are kept as the bytes objects edge-tts hands over, so a segment is
+    buffered and sent without ever being copied into a contiguous buffer.
+    """
+    audio = []
+    boundaries = []
+    async with _segment_semaphore:
+        async for chunk in _communicate(text, voice, boundary).stream():
+            if chunk["type"] == "audio":
+                audio.append(chunk["data"])
+            elif chunk["type"] == boundary:
+                boundaries.append(chunk)
+    return audio, boundaries
+
+
+async def _audio_stream(text, voice, submaker=None):
+    """Yield MP3 bytes for text, feeding word boundaries to submaker.
+
+    The first segment streams live while the rest are synthesized concurrently
+    in the background; their MP3 streams are appended in order, with subtitle
+    offsets shifted by the duration of the audio before them. Only the background
+    segments count against MAX_CONCURRENT_SEGMENTS, so a slow client reading the
+    live segment never holds up synthesis for other requests.
+    """
+    # Use WordBoundary for word-level subtitle timing
+    boundary = "WordBoundary" if submaker else "SentenceBoundary"
+    first, *rest = segment_text(text)
+    tasks = []
+    try:
+        audio_bytes = 0
+        tasks = [
+            asyncio.create_task(_synthesize_segment(segment, voice, boundary))
+            for segment in rest
+        ]
+        async for chunk in _communicate(first, voice, boundary).stream():
+            if chunk["type"] == "audio":
+                audio_bytes += len(chunk["data"])
+                yield chunk["data"]
+            elif submaker and chunk["type"] == boundary:
+                submaker.feed(chunk)
+
+        for task in tasks:
+            audio, boundaries = await task
+            if submaker:
+                shift = audio_bytes * 8 * TICKS_PER_SECOND // MP3_BITRATE
+                for chunk in boundaries:
+                    submaker.feed({**chunk, "offset": chunk["offset"] + shift})
+            for data in audio:
+                audio_bytes += len(data)
+                yield data
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _start_stream(chunks):
+    """Fetch the first chunk eagerly so edge-tts errors surface before headers are sent."""
+    first = await anext(chunks, b"")
+
+    async def body():
+        yield first
+        async for data in chunks:
+            yield data
+
+    return body()
+
+
+class _ZipSink:
+    """Write-only file object that collects zip output until the response drains it."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def write(self, data):
+        self.buffer += data
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+
+async def _zip_stream(text, voice):
+    """Yield a zip of the MP3 and its SRT, encoding audio as edge-tts produces it."""
+    submaker = edge_tts.SubMaker()
+    sink = _ZipSink()
+    # MP3 is already compressed, so only the SRT is worth deflating
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_STORED) as zf:
+        with zf.open("speech.mp3", "w") as entry:
+            async for data in _audio_stream(text, voice, submaker):
+                entry.write(data)
+                yield sink.drain()
+        zf.writestr("speech.srt", submaker.get_srt(), compress_type=zipfile.ZIP_DEFLATED)
+    yield sink.drain()
+
+
+# Rendered MP3s are kept on disk so repeated conversions skip synthesis entirely.
+# The directory is per user; on POSIX it must also be owned by us and private.
+CACHE_DIR = os.path.join(
+    tempfile.gettempdir(),
+    f"tts-cache-{os.getuid()}" if hasattr(os, "getuid") else "tts-cache",
+)
+CACHE_MAX_FILES = 64
+# Partial files untouched this long were left by a render the process never finished
+CACHE_PART_MAX_AGE = 10 * 60
+
+
+def _cache_path(text, voice):
+    """Return the cache file path for a (text, voice) pair."""
+    key = hashlib.blake2b(f"{voice}\0{text}".encode(), digest_size=16).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.mp3")
+
+
+def _ensure_cache_dir():
+    """Create the cache directory, refusing one another local user could have planted."""
+    os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+    if hasattr(os, "getuid"):
+        st = os.lstat(CACHE_DIR)
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+            raise PermissionError(f"Cache directory {CACHE_DIR} is not private to this user")
+
+
+def _lookup_cache(path):
+    """Return whether path is cached, marking a hit as recently used."""
+    _ensure_cache_dir()
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _evict_cache():
+    """Delete the least recently used cached MP3s beyond CACHE_MAX_FILES, and stale partial files."""
+    entries = []
+    stale = []
+    now = time.time()
+    for entry in os.scandir(CACHE_DIR):
+        with suppress(FileNotFoundError):
+            if entry.name.endswith(".mp3"):
+                entries.append((entry.stat().st_mtime, entry.path))
+            elif entry.name.endswith(".part") and now - entry.stat().st_mtime > CACHE_PART_MAX_AGE:
+                # Renders in progress write steadily, so only abandoned files get this old
+                stale.append(entry.path)
+    # Cache hits touch their file, so mtime orders entries by last use
+    entries.sort()
+    for path in [path for _, path in entries[:-CACHE_MAX_FILES]] + stale:
+        with suppress(FileNotFoundError):
+            os.unlink(path)
+
+
+def _publish_cache_file(f, tmp_path, path):
+    """Move a completely written cache file into place and evict old entries."""
+    f.close()
+    os.replace(tmp_path, path)
+    _evict_cache()
+
+
+def _discard_cache_file(f, tmp_path):
+    """Close and delete a partially written cache file."""
+    with suppress(OSError):
+        f.close()
+    with suppress(OSError):
+        os.unlink(tmp_path)
+
+
+async def _cached_stream(chunks, path):
+    """Pass audio through while writing it to the cache, publishing it only once complete.
+
+    Caching is best effort: if the file can't be created or written, the audio
+    still streams and the request just isn't cached.
+    """
+    try:
+        fd, tmp_path = await run_in_threadpool(tempfile.mkstemp, dir=CACHE_DIR, suffix=".part")
+        f = os.fdopen(fd, "wb")
+    except OSError:
+        f = None
+
+    try:
+        async for data in chunks:
+            if f:
+                try:
+                    await run_in_threadpool(f.write, data)
+                except OSError:
+                    _discard_cache_file(f, tmp_path)
+                    f = None
+            yield data
+    except BaseException:
+        if f:
+            _discard_cache_file(f, tmp_path)
+        raise
+
+    if f:
+        try:
+            await run_in_threadpool(_publish_cache_file, f, tmp_path, path)
+        except OSError:
+            _discard_cache_file(f, tmp_path)
 
 
 @app.post("/api/convert")
@@ -42,57 +454,45 @@ async def convert_text_to_speech(
     subtitles: bool = Form(False)
 ):
     """Convert text to MP3 speech using edge-tts, optionally with subtitles."""
+    _mark_active()
     if not text or not text.strip():
         raise HTTPException(status_code=400, detail="Text cannot be empty")
 
     if len(text) > 10000:
         raise HTTPException(status_code=400, detail="Text too long (max 10000 characters)")
 
-    try:
-        # Generate speech using selected voice
-        # Use WordBoundary for word-level subtitle timing
-        communicate = edge_tts.Communicate(
-            text.strip(),
-            voice=voice,
-            boundary="WordBoundary" if subtitles else "SentenceBoundary"
-        )
-        submaker = edge_tts.SubMaker() if subtitles else None
-
-        # Collect audio data in memory
-        audio_data = io.BytesIO()
-        async for chunk in communicate.stream():
-            if chunk["type"] == "audio":
-                audio_data.write(chunk["data"])
-            elif submaker and chunk["type"] == "WordBoundary":
-                submaker.feed(chunk)
-
-        audio_data.seek(0)
+    # Reject unknown voices locally rather than round-tripping to the service. Only
+    # an already loaded catalog is used; conversion never waits on fetching one.
+    if _voices_cache and voice not in _voices_cache.names:
+        raise HTTPException(status_code=400, detail=f"Unknown voice: {voice}")
 
-        # If subtitles requested, return a zip file with both MP3 and SRT
-        if subtitles:
-            srt_content = submaker.get_srt()
-
-            zip_buffer = io.BytesIO()
-            with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-                zf.writestr("speech.mp3", audio_data.read())
-                zf.writestr("speech.srt", srt_content)
-
-            zip_buffer.seek(0)
+    try:
+        if not subtitles:
+            path = _cache_path(text.strip(), voice)
+            try:
+                if await run_in_threadpool(_lookup_cache, path):
+                    return FileResponse(path, media_type="audio/mpeg", filename="speech.mp3")
+            except OSError:
+                path = None  # Cache unusable; just stream without it
 
-            return Response(
-                content=zip_buffer.read(),
-                media_type="application/zip",
+            # Stream just the MP3 straight through as edge-tts produces it
+            audio = _audio_stream(text.strip(), voice)
+            if path:
+                audio = _cached_stream(audio, path)
+            return StreamingResponse(
+                await _start_stream(audio),
+                media_type="audio/mpeg",
                 headers={
-                    "Content-Disposition": "attachment; filename=speech.zip"
+                    "Content-Disposition": "attachment; filename=speech.mp3"
                 }
             )
 
-        # Return just the MP3
-        return Response(
-            content=audio_data.read(),
-            media_type="audio/mpeg",
+        # Stream a zip file with both MP3 and SRT
+        return StreamingResponse(
+            await _start_stream(_zip_stream(text.strip(), voice)),
+            media_type="application/zip",
             headers={
-                "Content-Disposition": "attachment; filename=speech.mp3"
+                "Content-Disposition": "attachment; filename=speech.zip"
             }
         )
     except Exception as e:
@@ -14,14 +14,29 @@ Cross-compilation:
     Windows/macOS builds from Linux require GitHub Actions: gh workflow run build.yml
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
 import shutil
+import functools
 import argparse
+from collections import defaultdict
 from pathlib import Path
 
 
+def ensure_installed(module, package):
+    """Install a build tool with pip unless it is already importable."""
+    if importlib.util.find_spec(module) is not None:
+        return
+
+    print(f"\nInstalling {package}...")
+    subprocess.run(
+        [sys.executable, "-m", "pip", "install", package],
+        check=True
+    )
+
+
 def create_icon():
     """Create app icon if it doesn't exist."""
     icon_path = Path("assets/icon.png")
@@ -52,12 +67,18 @@ def create_icon():
     print(f"Created {icon_path}")
 
 
-def create_ico():
-    """Create Windows ICO file from PNG."""
+@functools.cache
+def load_master_icon():
+    """Decode assets/icon.png to RGBA once for every icon format built from it."""
     from PIL import Image
 
+    return Image.open("assets/icon.png").convert("RGBA")
+
+
+def create_ico():
+    """Create Windows ICO file from PNG."""
     print("Creating icon.ico...")
-    img = Image.open("assets/icon.png")
+    img = load_master_icon()
     img.save(
         "assets/icon.ico",
         format='ICO',
@@ -75,8 +96,6 @@ def create_icns():
     iconset = Path("assets/icon.iconset")
     iconset.mkdir(exist_ok=True)
 
-    img = Image.open("assets/icon.png")
-
     # Create all required sizes
     sizes = {
         'icon_16x16.png': 16,
@@ -91,9 +110,20 @@ def create_icns():
         'icon_512x512@2x.png': 1024,
     }
 
+    # @2x variants share pixel sizes with the next size up, so resize each size once
+    files_by_size = defaultdict(list)
     for filename, size in sizes.items():
-        resized = img.resize((size, size), Image.Resampling.LANCZOS)
-        resized.save(iconset / filename)
+        files_by_size[size].append(iconset / filename)
+
+    # Resizing serially is faster than a process pool at icon sizes, where
+    # starting workers costs more than the resizes themselves
+    master = load_master_icon()
+    for size, paths in files_by_size.items():
+        master.resize((size, size), Image.Resampling.LANCZOS).save(paths[0])
+
+    for first, *aliases in files_by_size.values():
+        for alias in aliases:
+            shutil.copyfile(first, alias)
 
     # Use iconutil to create icns (macOS only)
     subprocess.run(
@@ -113,11 +143,7 @@ def build_windows_native():
 
     create_ico()
 
-    print("\nInstalling PyInstaller...")
-    subprocess.run(
-        [sys.executable, "-m", "pip", "install", "pyinstaller"],
-        check=True
-    )
+    ensure_installed("PyInstaller", "pyinstaller")
 
     print("\nBuilding executable...")
     subprocess.run(
@@ -139,11 +165,7 @@ def build_mac_native():
 
     create_icns()
 
-    print("\nInstalling py2app...")
-    subprocess.run(
-        [sys.executable, "-m", "pip", "install", "py2app"],
-        check=True
-    )
+    ensure_installed("py2app", "py2app")
 
     print("\nBuilding app bundle...")
     subprocess.run(
@@ -163,11 +185,7 @@ def build_linux():
     print("Building TTS Converter for Linux")
     print("=" * 50)
 
-    print("\nInstalling PyInstaller...")
-    subprocess.run(
-        [sys.executable, "-m", "pip", "install", "pyinstaller"],
-        check=True
-    )
+    ensure_installed("PyInstaller", "pyinstaller")
 
     print("\nBuilding executable...")
     subprocess.run(
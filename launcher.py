@@ -7,6 +7,7 @@ Starts the FastAPI server, opens the browser, and displays a system tray icon.
 
 import sys
 import os
+import socket
 import threading
 import webbrowser
 import time
@@ -34,12 +35,8 @@ sys.path.insert(0, BASE_DIR)
 # Change to correct directory BEFORE importing app.main (static files use relative paths)
 os.chdir(BASE_DIR)
 
-import uvicorn
-from pystray import Icon, Menu, MenuItem
-from PIL import Image
-
-# Import the FastAPI app directly (required for PyInstaller - string imports don't work)
-from app.main import app as fastapi_app
+# uvicorn, the FastAPI app, pystray and PIL are imported where they are used, so
+# the server thread can load the app while the tray icon is being set up
 
 PORT = 8000
 URL = f"http://localhost:{PORT}"
@@ -58,6 +55,11 @@ class TTSApp:
         asyncio.set_event_loop(loop)
 
         try:
+            import uvicorn
+
+            # Import the FastAPI app directly (required for PyInstaller - string imports don't work)
+            from app.main import app as fastapi_app
+
             config = uvicorn.Config(
                 fastapi_app,  # Use imported app object directly (string imports fail in PyInstaller)
                 host="127.0.0.1",
@@ -77,8 +79,14 @@ class TTSApp:
             raise
 
     def open_browser(self):
-        """Open the default browser after a short delay."""
-        time.sleep(1.5)  # Wait for server to start
+        """Open the default browser once the server accepts connections."""
+        deadline = time.monotonic() + 10  # Give up waiting and open anyway
+        while time.monotonic() < deadline:
+            try:
+                socket.create_connection(("127.0.0.1", PORT), timeout=0.05).close()
+                break
+            except OSError:
+                time.sleep(0.02)
         webbrowser.open(URL)
 
     def on_open_browser(self, icon, item):
@@ -93,6 +101,8 @@ class TTSApp:
 
     def load_icon(self):
         """Load the app icon."""
+        from PIL import Image
+
         icon_path = os.path.join(BASE_DIR, "assets", "icon.png")
         if os.path.exists(icon_path):
             return Image.open(icon_path)
@@ -112,6 +122,8 @@ class TTSApp:
         browser_thread.start()
 
         # Create system tray icon
+        from pystray import Icon, Menu, MenuItem
+
         image = self.load_icon()
         menu = Menu(
             MenuItem("Open Browser", self.on_open_browser),
@@ -39,6 +39,9 @@ OPTIONS = {
         'aiohttp',
         'multidict',
         'yarl',
+        'orjson',
+        'uvloop',
+        'httptools',
     ],
     'includes': [
         'app.main',
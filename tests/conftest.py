@@ -0,0 +1,23 @@
+import os
+import sys
+
+import edge_tts
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# app.main is imported from the repo root and mounts static/ relative to the working directory
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from app import main  # noqa: E402
+from fakes import FakeCommunicate, fake_list_voices  # noqa: E402
+
+
+@pytest.fixture
+def fake_tts(monkeypatch, tmp_path):
+    """Replace the edge-tts service with fakes and cache into a fresh directory."""
+    monkeypatch.setattr(edge_tts, "Communicate", FakeCommunicate)
+    monkeypatch.setattr(edge_tts, "list_voices", fake_list_voices)
+    monkeypatch.setattr(main, "_voices_cache", None)
+    monkeypatch.setattr(main, "CACHE_DIR", str(tmp_path / "cache"))
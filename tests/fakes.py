@@ -0,0 +1,49 @@
+import asyncio
+
+from app import main
+
+# 6000 bytes of 48 kbps CBR MP3 is exactly one second of audio
+BYTES_PER_WORD = 6000
+
+
+class FakeCommunicate:
+    """Stand-in for edge_tts.Communicate: one second of audio and a boundary per word.
+
+    Offsets restart at zero for every instance, as they do for each real edge-tts call.
+    """
+
+    def __init__(self, text, voice=None, boundary=None, connector=None):
+        self.words = text.split()
+        self.boundary = boundary
+
+    async def stream(self):
+        for i, word in enumerate(self.words):
+            await asyncio.sleep(0)
+            yield {"type": "audio", "data": word.encode().ljust(BYTES_PER_WORD, b"~")}
+            yield {
+                "type": self.boundary,
+                "offset": i * main.TICKS_PER_SECOND,
+                "duration": main.TICKS_PER_SECOND // 2,
+                "text": word,
+            }
+
+
+def long_text(sentences=80):
+    return " ".join(f"Sentence number {i} here." for i in range(sentences))
+
+
+async def fake_list_voices(connector=None):
+    return [{
+        "ShortName": "en-US-ChristopherNeural",
+        "Gender": "Male",
+        "Locale": "en-US",
+    }]
+
+
+def run_in_app(coro_fn):
+    """Run coro_fn() on a fresh event loop inside the app's lifespan, as a server would."""
+    async def run():
+        async with main.lifespan(main.app):
+            return await coro_fn()
+
+    return asyncio.run(run())
@@ -0,0 +1,114 @@
+import errno
+import os
+import time
+
+import edge_tts
+from fastapi.testclient import TestClient
+
+from app import main
+from fakes import BYTES_PER_WORD, run_in_app
+
+
+class FailingCommunicate:
+    """edge-tts stand-in for asserting a request never reaches the service."""
+
+    def __init__(self, *args, **kwargs):
+        raise AssertionError("edge-tts called for a cached conversion")
+
+
+def _convert(text):
+    with TestClient(main.app) as client:
+        return client.post("/api/convert", data={"text": text})
+
+
+def _cache_files():
+    return sorted(os.listdir(main.CACHE_DIR))
+
+
+def test_repeat_conversion_is_served_from_cache(fake_tts, monkeypatch):
+    first = _convert("Hello cached world.")
+    assert first.status_code == 200
+    assert len(first.content) == 3 * BYTES_PER_WORD
+    assert [name[-4:] for name in _cache_files()] == [".mp3"]
+    assert os.stat(main.CACHE_DIR).st_mode & 0o777 == 0o700
+
+    monkeypatch.setattr(edge_tts, "Communicate", FailingCommunicate)
+    second = _convert("Hello cached world.")
+    assert second.status_code == 200
+    assert second.content == first.content
+
+
+def test_cache_dir_open_to_other_users_is_not_used(fake_tts):
+    path = main._cache_path("Hello there.", "en-US-ChristopherNeural")
+    os.makedirs(main.CACHE_DIR)
+    os.chmod(main.CACHE_DIR, 0o777)
+    with open(path, "wb") as f:
+        f.write(b"planted")
+
+    response = _convert("Hello there.")
+    assert response.status_code == 200
+    assert len(response.content) == 2 * BYTES_PER_WORD
+    assert _cache_files() == [os.path.basename(path)]
+
+
+def test_cache_dir_that_is_not_a_directory_is_not_used(fake_tts):
+    with open(main.CACHE_DIR, "wb"):
+        pass
+
+    response = _convert("Hello there.")
+    assert response.status_code == 200
+    assert len(response.content) == 2 * BYTES_PER_WORD
+
+
+def test_failed_cache_write_still_streams_audio(fake_tts, monkeypatch):
+    real_fdopen = os.fdopen
+
+    class FullDisk:
+        def __init__(self, fd, mode):
+            self.f = real_fdopen(fd, mode)
+
+        def write(self, data):
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        def close(self):
+            self.f.close()
+
+    monkeypatch.setattr(main.os, "fdopen", FullDisk)
+
+    response = _convert("Hello there.")
+    assert response.status_code == 200
+    assert len(response.content) == 2 * BYTES_PER_WORD
+    assert _cache_files() == []
+
+
+def test_abandoned_stream_leaves_no_cache_file(fake_tts):
+    async def read_first_chunk():
+        path = main._cache_path("Hello there.", "voice")
+        main._ensure_cache_dir()
+        stream = main._cached_stream(main._audio_stream("Hello there.", "voice"), path)
+        await anext(stream)
+        await stream.aclose()
+
+    run_in_app(read_first_chunk)
+    assert _cache_files() == []
+
+
+def test_eviction_keeps_recent_files_and_removes_stale_parts(fake_tts, monkeypatch):
+    monkeypatch.setattr(main, "CACHE_MAX_FILES", 2)
+    main._ensure_cache_dir()
+    now = time.time()
+    ages = {
+        "oldest.mp3": 300,
+        "older.mp3": 200,
+        "newest.mp3": 100,
+        "abandoned.part": main.CACHE_PART_MAX_AGE + 60,
+        "writing.part": 5,
+    }
+    for name, age in ages.items():
+        path = os.path.join(main.CACHE_DIR, name)
+        with open(path, "wb"):
+            pass
+        os.utime(path, (now - age, now - age))
+
+    main._evict_cache()
+    assert _cache_files() == ["newest.mp3", "older.mp3", "writing.part"]
@@ -0,0 +1,40 @@
+from fastapi.testclient import TestClient
+
+from app import main
+
+client = TestClient(main.app)
+
+
+def test_declared_length_over_limit_is_rejected():
+    response = client.post(
+        "/api/convert",
+        content=b"x" * (main.MAX_CONVERT_BODY + 1),
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    assert response.status_code == 413
+
+
+def test_chunked_upload_over_limit_is_rejected():
+    def body():
+        for _ in range(8):
+            yield b"x" * (main.MAX_CONVERT_BODY // 4)
+
+    response = client.post(
+        "/api/convert",
+        content=body(),
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    assert response.status_code == 413
+
+
+def test_other_paths_are_not_limited():
+    response = client.post("/", content=b"x" * (main.MAX_CONVERT_BODY + 1))
+    assert response.status_code == 405
+
+
+def test_longest_urlencoded_text_is_accepted(fake_tts):
+    # Four UTF-8 bytes per character, each sent as %XX
+    with TestClient(main.app) as app_client:
+        response = app_client.post("/api/convert", data={"text": "\U0001F600" * 10000})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "audio/mpeg"
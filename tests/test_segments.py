@@ -0,0 +1,56 @@
+import re
+
+import edge_tts
+
+from app import main
+from fakes import BYTES_PER_WORD, long_text, run_in_app
+
+
+def test_segment_text_splits_at_sentences():
+    text = long_text()
+    segments = main.segment_text(text)
+
+    assert len(segments) > 1
+    assert " ".join(segments) == text
+    assert all(len(segment) < main.SEGMENT_CHARS for segment in segments)
+    assert all(segment.endswith(".") for segment in segments)
+
+
+def test_segment_text_keeps_short_text_whole():
+    assert main.segment_text("Hello there. How are you?") == ["Hello there. How are you?"]
+
+
+def test_segmented_audio_is_in_order_with_monotonic_subtitles(fake_tts):
+    text = long_text()
+    words = text.split()
+
+    async def render():
+        submaker = edge_tts.SubMaker()
+        audio = b"".join([data async for data in main._audio_stream(text, "voice", submaker)])
+        return audio, submaker.get_srt()
+
+    audio, srt = run_in_app(render)
+
+    spoken = [
+        audio[i:i + BYTES_PER_WORD].rstrip(b"~").decode()
+        for i in range(0, len(audio), BYTES_PER_WORD)
+    ]
+    assert spoken == words
+
+    # Each word starts exactly one second after the previous one, across segment joins
+    starts = [
+        int(h) * 3600 + int(m) * 60 + int(s)
+        for h, m, s in re.findall(r"(\d+):(\d\d):(\d\d),000 -->", srt)
+    ]
+    assert starts == list(range(len(words)))
+
+
+def test_segmented_audio_runs_on_successive_event_loops(fake_tts):
+    # Enough segments that background syntheses have to wait on the concurrency cap
+    text = long_text(300)
+
+    async def render():
+        return b"".join([data async for data in main._audio_stream(text, "voice")])
+
+    first = run_in_app(render)
+    assert run_in_app(render) == first
@@ -23,6 +23,7 @@ a = Analysis(
         'uvicorn.loops',
         'uvicorn.loops.auto',
         'uvicorn.loops.asyncio',
+        'uvicorn.loops.uvloop',
         'uvicorn.protocols',
         'uvicorn.protocols.http',
         'uvicorn.protocols.http.auto',
@@ -48,6 +49,7 @@ a = Analysis(
         # HTTP/async dependencies
         'h11',
         'httptools',
+        'uvloop',
         'websockets',
         'aiohttp',
         # FastAPI/Starlette
@@ -59,6 +61,7 @@ a = Analysis(
         'anyio',
         'anyio._backends',
         'anyio._backends._asyncio',
+        'orjson',
     ],
     hookspath=[],
     hooksconfig={},